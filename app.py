@@ -17,6 +17,7 @@ if os.path.isdir(SCRIPT_DIR) and SCRIPT_DIR not in sys.path:
 # Import existing modules (must be in scripts/)
 import parse_resumes as parser
 import match_resumes as matcher
+import taxonomy
 
 # Optional: text-extraction imports for pdf/docx (if your app already has them)
 try:
@@ -34,6 +35,8 @@ except Exception:
 
 app = Flask(__name__, template_folder="templates")
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024
+# Scoring mode from match_resumes.SCORING_MODES (see scripts/evaluate_scoring.py for speed/quality)
+app.config['SCORING_MODE'] = os.environ.get("SCORING_MODE", matcher.DEFAULT_SCORING_MODE)
 
 # Paths
 PROJECT_ROOT = os.path.abspath(os.path.dirname(__file__))
@@ -129,17 +132,14 @@ def file_to_dataframe(uploaded_file_path, original_filename):
 def extract_skills_from_text(jd_text):
     """
     Lightweight skill/role extraction from JD text:
-    - Uses the parser's skills_list (if available) for exact matches
+    - Uses the current keyword taxonomy (taxonomy.json) for exact matches
     - Falls back to selecting frequent capitalized tokens as candidate skills
     """
     jd_text = str(jd_text or "")
     skills_found = set()
-    # try parse_resumes' internal list if present
+    # skills from the keyword taxonomy (hot-reloaded if taxonomy.json changed)
     try:
-        skill_candidates = getattr(parser, "skills_list", [])
-        for s in skill_candidates:
-            if s.lower() in jd_text.lower():
-                skills_found.add(s)
+        skills_found.update(taxonomy.match_terms(jd_text, "skills"))
     except Exception:
         pass
 
@@ -171,6 +171,24 @@ def list_jds():
     return jsonify({"default_jds": DEFAULT_JOB_DESCRIPTIONS, "saved_jds": saved})
 
 
+@app.route("/taxonomy", methods=["GET"])
+def get_taxonomy():
+    current = taxonomy.get_matcher()
+    return jsonify({"taxonomy_version": current["tag"], "version": current["version"],
+                    "counts": {field: len(current["terms"][field]) for field in taxonomy.FIELDS}})
+
+
+@app.route("/taxonomy/reload", methods=["POST"])
+def reload_taxonomy():
+    """Force a taxonomy reload (edits to taxonomy.json are also picked up automatically on next use)."""
+    try:
+        current = taxonomy.reload(strict=True)
+    except Exception as e:
+        # the previously loaded taxonomy (if any) stays in use; report which one
+        return jsonify({"error": f"Could not load taxonomy: {e}", "taxonomy_version": taxonomy.current_tag(refresh=False)}), 500
+    return jsonify({"taxonomy_version": current["tag"]})
+
+
 @app.route("/add_jd", methods=["POST"])
 def add_jd():
     """
@@ -291,7 +309,10 @@ def analyze():
     parsed_df = parser.parse_resumes_df(df, text_col="resume_text", id_col="ID")
 
     # Score
-    scored_df = matcher.match_all(parsed_df, jds_to_score)
+    scoring_mode = app.config['SCORING_MODE']
+    if scoring_mode not in matcher.SCORING_MODES:
+        return jsonify({"error": f"Unknown scoring mode '{scoring_mode}'; choose from {sorted(matcher.SCORING_MODES)}"}), 500
+    scored_df = matcher.SCORING_MODES[scoring_mode](parsed_df, jds_to_score)
 
     # Save temp CSV for download
     tmp_out = tempfile.NamedTemporaryFile(delete=False, suffix=".csv", prefix="resume_scores_")
@@ -310,7 +331,9 @@ def analyze():
     if len(df) == 1:
         extracted_snippet = str(df.iloc[0].get("resume_text", ""))[:400]
 
-    return jsonify({"results": results, "download_url": download_url, "extracted_snippet": extracted_snippet})
+    taxonomy_version = str(parsed_df["taxonomy_version"].iloc[0]) if not parsed_df.empty else taxonomy.current_tag()
+    return jsonify({"results": results, "download_url": download_url, "extracted_snippet": extracted_snippet,
+                    "taxonomy_version": taxonomy_version})
 
 
 @app.route("/download/<path:filename>", methods=["GET"])
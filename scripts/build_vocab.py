@@ -1,5 +1,6 @@
 # build_vocab.py
 # Description: Build simple vocab (skills, roles, education) from dataset text column.
+#              Roles/education found are those from taxonomy.json; skills are candidate words for extending it.
 # Behavior: Takes a dataset path as input (optional). If not provided it uses "Dataset/Resume.csv".
 # Outputs: automatically saves to "output/kaggle_vocab.pkl" (no need to pass an output path).
 #
@@ -12,6 +13,8 @@ import argparse
 import pandas as pd
 import pickle
 
+import taxonomy
+
 # -------------------------
 # EDIT ONLY THIS DEFAULT if you want a different default dataset path
 DEFAULT_INPUT = r"C:\Users\Manvi\Documents\AI based resume analyzer\Dataset\Resume.csv"
@@ -23,20 +26,17 @@ def build_vocab_from_df(df, text_col="Resume_str"):
     roles_vocab = set()
     edu_vocab = set()
 
-    edu_keywords = ["B.Tech", "M.Tech", "B.Sc", "MBA", "B.Des", "Diploma", "BBA", "PhD", "BE", "MSc", "BCA", "MCA"]
-    role_keywords = ["Software Engineer", "Data Analyst", "HR Manager", "Graphic Designer", "Teacher", "Consultant"]
+    matcher = taxonomy.get_matcher()
 
     for text in df[text_col].fillna("").astype(str):
         words = set([w.strip().title() for w in text.split()])
         skills_vocab.update(words)
-        for r in role_keywords:
-            if r.lower() in text.lower():
-                roles_vocab.add(r)
-        for e in edu_keywords:
-            if e.lower() in text.lower():
-                edu_vocab.add(e)
+        fields = taxonomy.match_fields(text, matcher)
+        roles_vocab.update(fields["roles"])
+        edu_vocab.update(fields["education"])
 
-    return {"skills": sorted(skills_vocab), "roles": sorted(roles_vocab), "edu": sorted(edu_vocab)}
+    return {"skills": sorted(skills_vocab), "roles": sorted(roles_vocab), "edu": sorted(edu_vocab),
+            "taxonomy_version": matcher["tag"]}
 
 
 def main():
@@ -1,30 +1,80 @@
 # create_eval_csv.py
-# Description: Create an evaluation CSV by sampling resumes and pairing with example JDs.
+# Description: Create a labelled evaluation CSV by sampling resumes and pairing each with every example JD.
 # Behavior: Takes a dataset path as input (optional). If not provided it uses "Dataset/Resume.csv".
+#           Sampling is stratified by the dataset's Category column and seeded, so the same
+#           --seed always produces the same set. Relevance labels are derived from Category
+#           (weak labels, see CATEGORY_RELEVANCE below): 2 = primary category, 1 = related, 0 = other.
 # Outputs: automatically saves to "output/evaluation_data.csv" (no need to pass an output path).
 #
 # Place this file in your project root (same folder that contains Dataset/, output/, scripts/).
 # Run: python create_eval_csv.py
-# Or:  python create_eval_csv.py -i "C:/full/path/to/Resume.csv"
+# Or:  python create_eval_csv.py -i "C:/full/path/to/Resume.csv" --per-category 20 --seed 42
 
 import os
 import argparse
-import random
 import pandas as pd
 
+from match_resumes import DEFAULT_JDS
+
 # -------------------------
 # EDIT ONLY THIS DEFAULT if you want a different default dataset path
 DEFAULT_INPUT = r"C:\Users\Manvi\Documents\AI based resume analyzer\Dataset\Resume.csv"
 OUTPUT_EVAL = "output/evaluation_data.csv"
-SAMPLE_SIZE_DEFAULT = 30
+SAMPLE_PER_CATEGORY_DEFAULT = 20
+SEED_DEFAULT = 42
 # -------------------------
 
+# Weak relevance labels: jd_id -> {dataset Category: grade}. Categories not listed are grade 0.
+CATEGORY_RELEVANCE = {
+    "JD1": {"INFORMATION-TECHNOLOGY": 2, "ENGINEERING": 1},
+    "JD2": {"INFORMATION-TECHNOLOGY": 1, "FINANCE": 1, "BANKING": 1, "ACCOUNTANT": 1},
+    "JD3": {"DESIGNER": 2, "ARTS": 1, "DIGITAL-MEDIA": 1},
+    "JD4": {"HR": 2},
+}
+
+
+def build_eval_set(df, job_descriptions=None, per_category=SAMPLE_PER_CATEGORY_DEFAULT,
+                   seed=SEED_DEFAULT, category_col="Category"):
+    """
+    Return (sampled_df, labels_df).
+    sampled_df: up to per_category resumes from each Category (seeded, sorted by category).
+    labels_df: one row per (resume, JD) with columns resume_id, category, jd_id, relevance_score.
+    """
+    if category_col not in df.columns:
+        raise ValueError(f"Dataset has no '{category_col}' column; it is needed for relevance labels.")
+    job_descriptions = job_descriptions or DEFAULT_JDS
+    unlabelled = [jd["jd_id"] for jd in job_descriptions if jd["jd_id"] not in CATEGORY_RELEVANCE]
+    if unlabelled:
+        raise ValueError(f"No relevance labels for JD(s) {', '.join(unlabelled)}; add them to CATEGORY_RELEVANCE.")
+
+    parts = []
+    for _, group in sorted(df.groupby(category_col), key=lambda kv: str(kv[0])):
+        parts.append(group.sample(min(per_category, len(group)), random_state=seed))
+    sampled_df = pd.concat(parts) if parts else df.iloc[0:0]
+    if "ID" not in sampled_df.columns:
+        sampled_df = sampled_df.assign(ID=sampled_df.index)
+
+    labels = []
+    for resume_id, category in zip(sampled_df["ID"], sampled_df[category_col]):
+        for jd in job_descriptions:
+            grades = CATEGORY_RELEVANCE.get(jd["jd_id"], {})
+            labels.append({
+                "resume_id": resume_id,
+                "category": category,
+                "jd_id": jd["jd_id"],
+                "relevance_score": grades.get(str(category).upper(), 0)
+            })
+    return sampled_df, pd.DataFrame(labels)
+
+
 def main():
-    ap = argparse.ArgumentParser(description="Create evaluation CSV from dataset (sampled).")
+    ap = argparse.ArgumentParser(description="Create labelled evaluation CSV from dataset (seeded, per-category sample).")
     ap.add_argument("--input", "-i", required=False, default=DEFAULT_INPUT,
                     help=f"Path to resume CSV (default: {DEFAULT_INPUT})")
-    ap.add_argument("--sample-size", "-n", required=False, type=int, default=SAMPLE_SIZE_DEFAULT,
-                    help=f"Number of resumes to sample (default: {SAMPLE_SIZE_DEFAULT})")
+    ap.add_argument("--per-category", required=False, type=int, default=SAMPLE_PER_CATEGORY_DEFAULT,
+                    help=f"Number of resumes to sample per Category (default: {SAMPLE_PER_CATEGORY_DEFAULT})")
+    ap.add_argument("--seed", required=False, type=int, default=SEED_DEFAULT,
+                    help=f"Random seed for sampling (default: {SEED_DEFAULT})")
     args = ap.parse_args()
 
     input_path = args.input
@@ -33,33 +83,34 @@ def main():
 
     df = pd.read_csv(input_path)
     print(f"Loaded {len(df)} resumes from {input_path}")
+    if "Resume_str" in df.columns and "resume_text" not in df.columns:
+        df = df.rename(columns={"Resume_str": "resume_text"})
+    if "resume_text" not in df.columns:
+        raise ValueError("Dataset has no 'Resume_str' or 'resume_text' column.")
 
-    job_descriptions = [
-        {"jd_id": "JD1", "title": "Software Engineer", "skills": ["Python", "Machine Learning", "AI", "SQL"]},
-        {"jd_id": "JD2", "title": "Data Analyst", "skills": ["Excel", "Power BI", "Statistics", "Python"]},
-        {"jd_id": "JD3", "title": "Graphic Designer", "skills": ["Photoshop", "Illustrator", "Creativity"]},
-        {"jd_id": "JD4", "title": "HR Manager", "skills": ["Recruitment", "Communication", "Payroll", "Leadership"]}
-    ]
+    sampled_df, labels_df = build_eval_set(df, DEFAULT_JDS, per_category=args.per_category, seed=args.seed)
 
-    sample_size = min(args.sample_size, len(df))
+    jds_by_id = {jd["jd_id"]: jd for jd in DEFAULT_JDS}
+    texts = dict(zip(sampled_df["ID"], sampled_df["resume_text"].fillna("").astype(str).str[:800]))
     eval_data = []
-    for _, row in df.sample(sample_size).iterrows():
-        jd = random.choice(job_descriptions)
-        resume_text = str(row.get("Resume_str", row.get("resume_text", "")))[:800]
+    for _, row in labels_df.iterrows():
+        jd = jds_by_id[row["jd_id"]]
+        resume_text = texts.get(row["resume_id"], "")
         matched_skills = [s for s in jd["skills"] if s.lower() in resume_text.lower()]
         eval_data.append({
-            "resume_id": row.get("ID", ""),
+            "resume_id": row["resume_id"],
+            "category": row["category"],
             "jd_id": jd["jd_id"],
             "jd_title": jd["title"],
             "jd_skills": ", ".join(jd["skills"]),
-            "relevance_score": random.randint(0, 3),
+            "relevance_score": row["relevance_score"],
             "matched_skills": ", ".join(matched_skills),
             "resume_text_snippet": resume_text[:300]
         })
 
     os.makedirs(os.path.dirname(OUTPUT_EVAL) or "output", exist_ok=True)
     pd.DataFrame(eval_data).to_csv(OUTPUT_EVAL, index=False)
-    print(f"Saved evaluation CSV to: {OUTPUT_EVAL} (sampled {sample_size} resumes)")
+    print(f"Saved evaluation CSV to: {OUTPUT_EVAL} (sampled {len(sampled_df)} resumes, seed {args.seed})")
 
 
 if __name__ == "__main__":
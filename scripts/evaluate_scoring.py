@@ -0,0 +1,138 @@
+# evaluate_scoring.py
+# Description: Compare scoring modes (match_resumes.SCORING_MODES) on ranking quality and cost.
+# Behavior: Takes a dataset path as input (optional). If not provided it uses "Dataset/Resume.csv".
+#           Builds the seeded, Category-labelled set from create_eval_csv.build_eval_set, parses the
+#           sampled resumes once, then for each scoring mode ranks resumes per JD and reports
+#           NDCG@k / precision@k together with latency and peak Python memory of the scoring call.
+# Outputs: automatically saves to "output/scoring_eval.csv" (no need to pass an output path).
+#
+# Place this file in your project root (same folder that contains Dataset/, output/, scripts/).
+# Run: python evaluate_scoring.py
+# Or:  python evaluate_scoring.py -i "C:/full/path/to/Resume.csv" -k 10 --repeat 5
+
+import os
+import math
+import time
+import argparse
+import tracemalloc
+import pandas as pd
+
+import parse_resumes
+from match_resumes import DEFAULT_JDS, SCORING_MODES
+from create_eval_csv import build_eval_set, SAMPLE_PER_CATEGORY_DEFAULT, SEED_DEFAULT
+
+# -------------------------
+# EDIT ONLY THIS DEFAULT if you want a different default dataset path
+DEFAULT_INPUT = r"C:\Users\Manvi\Documents\AI based resume analyzer\Dataset\Resume.csv"
+OUTPUT_REPORT = "output/scoring_eval.csv"
+K_DEFAULT = 10
+REPEAT_DEFAULT = 3
+# -------------------------
+
+
+def ndcg_at_k(relevances, k):
+    """relevances: graded labels in ranked order. Uses the (2^rel - 1) / log2(rank + 1) gain."""
+    def dcg(rels):
+        return sum((2 ** r - 1) / math.log2(i + 2) for i, r in enumerate(rels[:k]))
+    ideal = dcg(sorted(relevances, reverse=True))
+    return dcg(relevances) / ideal if ideal > 0 else 0.0
+
+
+def precision_at_k(relevances, k):
+    """Fraction of the top k with any positive relevance grade."""
+    top = relevances[:k]
+    return sum(1 for r in top if r > 0) / k if k else 0.0
+
+
+def _mean(values):
+    return sum(values) / len(values) if values else 0.0
+
+
+def rank_quality(scored_df, labels_df, k):
+    """Rank resumes per JD by score (ties broken by resume_id) and average the metrics over JDs."""
+    merged = scored_df.merge(labels_df[["resume_id", "jd_id", "relevance_score"]],
+                             on=["resume_id", "jd_id"], how="inner")
+    ndcgs, precisions = [], []
+    for _, group in merged.groupby("jd_id"):
+        if group["relevance_score"].max() <= 0:
+            continue  # no relevant resumes for this JD in the sample; metric undefined
+        ranked = group.sort_values(by=["score", "resume_id"], ascending=[False, True], kind="mergesort")
+        rels = ranked["relevance_score"].tolist()
+        ndcgs.append(ndcg_at_k(rels, k))
+        precisions.append(precision_at_k(rels, k))
+    return _mean(ndcgs), _mean(precisions)
+
+
+def measure(score_fn, parsed_df, job_descriptions, repeat):
+    """Return (result_df, best latency in seconds, peak traced memory in bytes)."""
+    timings = []
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        result = score_fn(parsed_df, job_descriptions)
+        timings.append(time.perf_counter() - start)
+
+    # measured separately so tracing overhead does not inflate the timings
+    tracemalloc.start()
+    score_fn(parsed_df, job_descriptions)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, min(timings), peak
+
+
+def evaluate_modes(parsed_df, labels_df, job_descriptions, modes=None, k=K_DEFAULT, repeat=REPEAT_DEFAULT):
+    """Run each scoring mode and return one report row per mode."""
+    modes = modes or SCORING_MODES
+    n_pairs = len(parsed_df) * len(job_descriptions)
+    report = []
+    for name, score_fn in modes.items():
+        scored_df, seconds, peak = measure(score_fn, parsed_df, job_descriptions, repeat)
+        ndcg, precision = rank_quality(scored_df, labels_df, k)
+        report.append({
+            "mode": name,
+            f"ndcg@{k}": round(ndcg, 4),
+            f"precision@{k}": round(precision, 4),
+            "latency_ms": round(seconds * 1000, 2),
+            "us_per_pair": round(seconds * 1e6 / n_pairs, 2) if n_pairs else 0.0,
+            "peak_mem_kb": round(peak / 1024, 1),
+            "pairs": n_pairs
+        })
+    return pd.DataFrame(report)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Evaluate ranking quality vs. cost of each scoring mode.")
+    ap.add_argument("--input", "-i", required=False, default=DEFAULT_INPUT,
+                    help=f"Path to resume CSV (default: {DEFAULT_INPUT})")
+    ap.add_argument("--per-category", required=False, type=int, default=SAMPLE_PER_CATEGORY_DEFAULT,
+                    help=f"Number of resumes to sample per Category (default: {SAMPLE_PER_CATEGORY_DEFAULT})")
+    ap.add_argument("--seed", required=False, type=int, default=SEED_DEFAULT,
+                    help=f"Random seed for sampling (default: {SEED_DEFAULT})")
+    ap.add_argument("-k", required=False, type=int, default=K_DEFAULT,
+                    help=f"Cut-off for NDCG@k / precision@k (default: {K_DEFAULT})")
+    ap.add_argument("--repeat", required=False, type=int, default=REPEAT_DEFAULT,
+                    help=f"Timing repetitions per mode; best run is reported (default: {REPEAT_DEFAULT})")
+    args = ap.parse_args()
+
+    input_path = args.input
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Input dataset not found: {input_path}")
+
+    df = pd.read_csv(input_path)
+    if "Resume_str" in df.columns and "resume_text" not in df.columns:
+        df = df.rename(columns={"Resume_str": "resume_text"})
+
+    sampled_df, labels_df = build_eval_set(df, DEFAULT_JDS, per_category=args.per_category, seed=args.seed)
+    parsed_df = parse_resumes.parse_resumes_df(sampled_df, text_col="resume_text", id_col="ID")
+    print(f"Evaluating {len(SCORING_MODES)} scoring modes on {len(parsed_df)} resumes x {len(DEFAULT_JDS)} JDs (seed {args.seed})")
+
+    report_df = evaluate_modes(parsed_df, labels_df, DEFAULT_JDS, k=args.k, repeat=args.repeat)
+    print(report_df.to_string(index=False))
+
+    os.makedirs(os.path.dirname(OUTPUT_REPORT) or ".", exist_ok=True)
+    report_df.to_csv(OUTPUT_REPORT, index=False)
+    print(f"Saved scoring evaluation to: {OUTPUT_REPORT}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 # match_resumes.py
 # Description: Parse the dataset (using parse_resumes.py) and score resumes against default JDs.
 # Behavior: Takes a dataset path as input (optional). If not provided it uses "Dataset/Resume.csv".
+#           With --parsed, reuses a CSV written by parse_resumes.py unless its taxonomy_version is stale.
+#           --mode picks a scoring mode from SCORING_MODES (compare them with evaluate_scoring.py).
 # Outputs: automatically saves to "output/resume_scores.csv" (no need to pass an output path).
 #
 # Place this file in your project root (same folder that contains Dataset/, output/, scripts/).
@@ -33,28 +35,43 @@ except Exception:
     have_parser = False
 
 
-def compute_similarity(resume_skills, resume_roles, resume_education, jd):
-    resume_skills_set = set([s.strip().lower() for s in str(resume_skills).split(",") if s.strip()])
-    resume_roles_set = set([r.strip().lower() for r in str(resume_roles).split(",") if r.strip()])
-    resume_edu_set = set([e.strip().lower() for e in str(resume_education).split(",") if e.strip()])
+def prepare_jd(jd):
+    """Lower-case and split a JD's skills/roles/education once so it can be reused across resumes."""
+    return {
+        "jd": jd,
+        "skills": set([s.strip().lower() for s in jd.get("skills", [])]),
+        "roles": set([r.strip().lower() for r in jd.get("roles", [])]),
+        "education": set([e.strip().lower() for e in jd.get("education", [])]),
+    }
+
+
+def _split_field(value):
+    return set([v.strip().lower() for v in str(value).split(",") if v.strip()])
 
-    jd_skills_set = set([s.strip().lower() for s in jd.get("skills", [])])
-    jd_roles_set = set([r.strip().lower() for r in jd.get("roles", [])])
-    jd_edu_set = set([e.strip().lower() for e in jd.get("education", [])])
 
-    skill_matches = resume_skills_set & jd_skills_set
-    skill_score = len(skill_matches) / len(jd_skills_set) if jd_skills_set else 0
+def score_sets(resume_skills_set, resume_roles_set, resume_edu_set, prepared_jd):
+    """
+    Weighted overlap score of already-normalised resume sets against a prepare_jd() result.
+    Shared by compute_similarity and match_all_fast so every scoring mode uses the same formula.
+    """
+    skill_matches = resume_skills_set & prepared_jd["skills"]
+    skill_score = len(skill_matches) / len(prepared_jd["skills"]) if prepared_jd["skills"] else 0
 
-    role_matches = resume_roles_set & jd_roles_set
-    role_score = len(role_matches) / len(jd_roles_set) if jd_roles_set else 0
+    role_matches = resume_roles_set & prepared_jd["roles"]
+    role_score = len(role_matches) / len(prepared_jd["roles"]) if prepared_jd["roles"] else 0
 
-    edu_matches = resume_edu_set & jd_edu_set
-    edu_score = len(edu_matches) / len(jd_edu_set) if jd_edu_set else 0
+    edu_matches = resume_edu_set & prepared_jd["education"]
+    edu_score = len(edu_matches) / len(prepared_jd["education"]) if prepared_jd["education"] else 0
 
     total_score = 0.5 * skill_score + 0.3 * role_score + 0.2 * edu_score
     return round(total_score, 2), skill_matches, role_matches, edu_matches
 
 
+def compute_similarity(resume_skills, resume_roles, resume_education, jd):
+    return score_sets(_split_field(resume_skills), _split_field(resume_roles),
+                      _split_field(resume_education), prepare_jd(jd))
+
+
 def match_all(parsed_df, job_descriptions):
     scored = []
     for _, row in parsed_df.iterrows():
@@ -69,29 +86,84 @@ def match_all(parsed_df, job_descriptions):
                 "score": score,
                 "skills_matched": ", ".join(sorted(skill_matches, key=str.lower)) if skill_matches else "",
                 "roles_matched": ", ".join(sorted(role_matches, key=str.lower)) if role_matches else "",
-                "education_matched": ", ".join(sorted(edu_matches, key=str.lower)) if edu_matches else ""
+                "education_matched": ", ".join(sorted(edu_matches, key=str.lower)) if edu_matches else "",
+                "taxonomy_version": row.get("taxonomy_version", "")
             })
     return pd.DataFrame(scored)
 
 
+def match_all_fast(parsed_df, job_descriptions):
+    """
+    Same scores as match_all, but each JD and each resume field is normalised only once
+    and rows are read column-wise instead of via iterrows.
+    """
+    prepared = [prepare_jd(jd) for jd in job_descriptions]
+    n = len(parsed_df)
+
+    def column(name, default=""):
+        return parsed_df[name].tolist() if name in parsed_df.columns else [default] * n
+
+    scored = []
+    for resume_id, skills, roles, education, version in zip(column("resume_id", None), column("skills"),
+                                                            column("roles"), column("education"),
+                                                            column("taxonomy_version")):
+        resume_skills_set = _split_field(skills)
+        resume_roles_set = _split_field(roles)
+        resume_edu_set = _split_field(education)
+        for p in prepared:
+            score, skill_matches, role_matches, edu_matches = score_sets(
+                resume_skills_set, resume_roles_set, resume_edu_set, p
+            )
+            scored.append({
+                "resume_id": resume_id,
+                "jd_id": p["jd"].get("jd_id"),
+                "jd_title": p["jd"].get("title"),
+                "score": score,
+                "skills_matched": ", ".join(sorted(skill_matches, key=str.lower)) if skill_matches else "",
+                "roles_matched": ", ".join(sorted(role_matches, key=str.lower)) if role_matches else "",
+                "education_matched": ", ".join(sorted(edu_matches, key=str.lower)) if edu_matches else "",
+                "taxonomy_version": version
+            })
+    return pd.DataFrame(scored)
+
+
+# Available scoring modes: name -> function(parsed_df, job_descriptions) returning the match_all columns.
+# scripts/evaluate_scoring.py benchmarks every entry here, so register new modes in this dict.
+SCORING_MODES = {
+    "exact": match_all,
+    "fast": match_all_fast,
+}
+DEFAULT_SCORING_MODE = "fast"  # same scores as "exact", several times faster
+
+
 def main():
     ap = argparse.ArgumentParser(description="Parse dataset and score resumes against default JDs.")
     ap.add_argument("--input", "-i", required=False, default=DEFAULT_INPUT,
                     help=f"Path to resume CSV (default: {DEFAULT_INPUT})")
+    ap.add_argument("--parsed", "-p", required=False, default=None,
+                    help="Optional parsed CSV from parse_resumes.py to reuse (re-parsed if its taxonomy is stale)")
+    ap.add_argument("--mode", "-m", required=False, default=DEFAULT_SCORING_MODE, choices=sorted(SCORING_MODES),
+                    help=f"Scoring mode (default: {DEFAULT_SCORING_MODE})")
     args = ap.parse_args()
 
+    parsed_df = parse_resumes.load_parsed(args.parsed) if (have_parser and args.parsed) else None
+    if parsed_df is not None:
+        print(f"Reusing parsed resumes from: {args.parsed}")
+    elif have_parser and args.parsed and os.path.exists(args.parsed):
+        print(f"{args.parsed} has a stale taxonomy_version, re-parsing (taxonomy {parse_resumes.taxonomy.current_tag()})")
+
     input_path = args.input
-    if not os.path.exists(input_path):
+    if parsed_df is None and not os.path.exists(input_path):
         raise FileNotFoundError(f"Dataset not found: {input_path}")
 
     # Use parse_resumes module if available
-    if have_parser:
+    if parsed_df is None and have_parser:
         df = pd.read_csv(input_path)
         # normalize column name if needed
         if "Resume_str" in df.columns and "resume_text" not in df.columns:
             df = df.rename(columns={"Resume_str": "resume_text"})
         parsed_df = parse_resumes.parse_resumes_df(df, text_col="resume_text", id_col="ID")
-    else:
+    elif parsed_df is None:
         # Inline simple parser fallback (same logic as parse_resumes)
         df = pd.read_csv(input_path)
         if "Resume_str" in df.columns and "resume_text" not in df.columns:
@@ -113,10 +185,10 @@ def main():
             })
         parsed_df = pd.DataFrame(parsed_rows)
 
-    scored_df = match_all(parsed_df, DEFAULT_JDS)
+    scored_df = SCORING_MODES[args.mode](parsed_df, DEFAULT_JDS)
     os.makedirs(os.path.dirname(OUTPUT_SCORES) or ".", exist_ok=True)
     scored_df.to_csv(OUTPUT_SCORES, index=False)
-    print(f"Saved resume scores to: {OUTPUT_SCORES}")
+    print(f"Saved resume scores to: {OUTPUT_SCORES} (mode: {args.mode})")
 
 
 if __name__ == "__main__":
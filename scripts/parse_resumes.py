@@ -1,5 +1,7 @@
 # parse_resumes.py
 # Description: Parse a resume CSV into structured fields (resume_id, skills, education, roles).
+#              Keywords come from the versioned taxonomy.json (see taxonomy.py); each parsed row is
+#              tagged with the taxonomy_version it was produced with.
 # Behavior: Takes a dataset path as input (optional). If not provided it uses "Dataset/Resume.csv".
 # Outputs: automatically saves to "output/parsed_resumes.csv" (no need to pass an output path).
 #
@@ -11,66 +13,64 @@ import os
 import argparse
 import pandas as pd
 
+import taxonomy
+
 # -------------------------
 # EDIT ONLY THIS DEFAULT if you want a different default dataset path
 DEFAULT_INPUT = r"C:\Users\Manvi\Documents\AI based resume analyzer\Dataset\Resume.csv"  # relative path recommended; can be absolute (use r"..." if contains backslashes)
 OUTPUT_PARSED = "output/parsed_resumes.csv"  # fixed output path (script writes here automatically)
 # -------------------------
 
-# Simple keyword lists (expandable)
-skills_list = [
-    "Python", "Java", "C++", "SQL", "Machine Learning", "AI", "Excel",
-    "Power BI", "Statistics", "Photoshop", "Illustrator", "Communication",
-    "Leadership", "Recruitment", "Payroll", "Deep Learning", "NLP"
-]
-education_list = [
-    "B.Tech", "BE", "M.Tech", "ME", "MBA", "B.Sc", "M.Sc", "PhD",
-    "Diploma", "High School", "Intermediate", "BCA", "MCA"
-]
-roles_list = [
-    "Software Engineer", "Data Analyst", "Graphic Designer", "HR Manager",
-    "Teacher", "Consultant", "Accountant", "Engineer", "Finance Manager",
-    "Sales Executive"
-]
-
 
-def extract_skills(text):
-    text_lower = str(text).lower()
-    matched = [skill for skill in skills_list if skill.lower() in text_lower]
-    return ", ".join(matched)
+def extract_skills(text, matcher=None):
+    return ", ".join(taxonomy.match_terms(text, "skills", matcher))
 
 
-def extract_education(text):
-    text_lower = str(text).lower()
-    matched = [edu for edu in education_list if edu.lower() in text_lower]
-    return ", ".join(matched)
+def extract_education(text, matcher=None):
+    return ", ".join(taxonomy.match_terms(text, "education", matcher))
 
 
-def extract_roles(text):
-    text_lower = str(text).lower()
-    matched = [role for role in roles_list if role.lower() in text_lower]
-    return ", ".join(matched)
+def extract_roles(text, matcher=None):
+    return ", ".join(taxonomy.match_terms(text, "roles", matcher))
 
 
 def parse_resumes_df(df, text_col="resume_text", id_col="ID"):
     """
     Parse resume DataFrame and return DataFrame with columns:
-    resume_id, skills, education, roles
+    resume_id, skills, education, roles, taxonomy_version
     """
+    matcher = taxonomy.get_matcher()  # resolved once so a reload mid-parse can't mix versions
     parsed_data = []
     has_id = id_col in df.columns
     for idx, row in df.iterrows():
         resume_text = str(row.get(text_col, ""))
         resume_id = row.get(id_col, idx) if has_id else idx
+        fields = taxonomy.match_fields(resume_text, matcher)
         parsed_data.append({
             "resume_id": resume_id,
-            "skills": extract_skills(resume_text),
-            "education": extract_education(resume_text),
-            "roles": extract_roles(resume_text)
+            "skills": ", ".join(fields["skills"]),
+            "education": ", ".join(fields["education"]),
+            "roles": ", ".join(fields["roles"]),
+            "taxonomy_version": matcher["tag"]
         })
     return pd.DataFrame(parsed_data)
 
 
+def is_stale(parsed_df):
+    """True if parsed_df was not produced with the current taxonomy (or predates version tagging)."""
+    if "taxonomy_version" not in parsed_df.columns:
+        return True
+    return bool((parsed_df["taxonomy_version"].astype(str) != taxonomy.current_tag()).any())
+
+
+def load_parsed(path):
+    """Load a parsed CSV written by this script; returns None if it is missing or stale."""
+    if not os.path.exists(path):
+        return None
+    parsed_df = pd.read_csv(path, keep_default_na=False)
+    return None if is_stale(parsed_df) else parsed_df
+
+
 def main():
     ap = argparse.ArgumentParser(description="Parse resumes CSV into structured fields.")
     ap.add_argument("--input", "-i", required=False, default=DEFAULT_INPUT,
@@ -89,7 +89,7 @@ def main():
 
     os.makedirs(os.path.dirname(OUTPUT_PARSED) or ".", exist_ok=True)
     parsed_df.to_csv(OUTPUT_PARSED, index=False)
-    print(f"Saved parsed resumes to: {OUTPUT_PARSED}")
+    print(f"Saved parsed resumes to: {OUTPUT_PARSED} (taxonomy {taxonomy.current_tag()})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+# taxonomy.py
+# Description: Load the versioned keyword taxonomy (skills, education, roles) and compile it into a matcher.
+# Behavior: Reads "taxonomy.json" from the project root. The compiled matcher is cached as a pickle
+#           artifact in "output/taxonomy_matcher.pkl" and reused by every process until the taxonomy
+#           file changes. get_matcher() re-checks the file's modification time, so edits are picked up
+#           by a running app without a restart.
+#           If pyahocorasick is installed the artifact holds a prebuilt Aho-Corasick automaton
+#           (one pass over the text for all terms); otherwise plain lower-cased term lists are used.
+# Outputs: "output/taxonomy_matcher.pkl" (written automatically when missing or out of date).
+#
+# Place this file in scripts/ (next to parse_resumes.py).
+# Run: python taxonomy.py                 (compile the default taxonomy.json)
+# Or:  python taxonomy.py -i "C:/full/path/to/taxonomy.json"
+
+import os
+import json
+import pickle
+import hashlib
+import argparse
+import threading
+
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+
+# -------------------------
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+TAXONOMY_PATH = os.path.join(PROJECT_ROOT, "taxonomy.json")
+ARTIFACT_PATH = os.path.join(PROJECT_ROOT, "output", "taxonomy_matcher.pkl")
+# -------------------------
+
+FIELDS = ("skills", "education", "roles")
+ARTIFACT_FORMAT = 1  # bump when the pickled layout below changes
+
+_lock = threading.Lock()
+_current = None        # compiled matcher dict currently in use
+_current_stamp = None  # (path, mtime, size) of the taxonomy file it was loaded from
+
+
+def _file_sha(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _file_stamp(path):
+    st = os.stat(path)
+    return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def compile_taxonomy(path=None):
+    """
+    Read and validate a taxonomy JSON file and return a compiled matcher dict:
+    version, sha256, tag ("<version>+<sha8>", stored on parsed results), terms and automaton.
+    """
+    path = path or TAXONOMY_PATH
+    # one read: hash and parse the same bytes, so a save during reload can't pair old terms with a new sha
+    with open(path, "rb") as f:
+        raw = f.read()
+    sha = hashlib.sha256(raw).hexdigest()
+    data = json.loads(raw.decode("utf-8"))
+    version = str(data.get("version", "")).strip()
+    if not version:
+        raise ValueError(f"Taxonomy file has no 'version': {path}")
+
+    terms = {}
+    for field in FIELDS:
+        values = data.get(field, [])
+        if not isinstance(values, list):
+            raise ValueError(f"Taxonomy field '{field}' must be a list: {path}")
+        terms[field] = [str(v) for v in values if str(v).strip()]
+
+    automaton = None
+    if ahocorasick:
+        automaton = ahocorasick.Automaton()
+        keys = {}
+        for field in FIELDS:
+            for idx, term in enumerate(terms[field]):
+                keys.setdefault(term.lower(), []).append((field, idx))
+        for key, hits in keys.items():
+            automaton.add_word(key, hits)
+        automaton.make_automaton()
+
+    return {
+        "format": ARTIFACT_FORMAT,
+        "version": version,
+        "sha256": sha,
+        "tag": f"{version}+{sha[:8]}",
+        "terms": terms,
+        "lowered": {field: [t.lower() for t in terms[field]] for field in FIELDS},
+        "automaton": automaton,
+    }
+
+
+def save_artifact(matcher, artifact_path=None):
+    artifact_path = artifact_path or ARTIFACT_PATH
+    os.makedirs(os.path.dirname(artifact_path) or ".", exist_ok=True)
+    tmp_path = artifact_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, artifact_path)  # atomic, so concurrent readers never see a partial file
+
+
+def load_artifact(artifact_path=None):
+    artifact_path = artifact_path or ARTIFACT_PATH
+    try:
+        with open(artifact_path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def load_matcher(path=None, artifact_path=None):
+    """Return the compiled matcher for path, reusing the artifact if it was built from the same file contents."""
+    path = path or TAXONOMY_PATH
+    artifact_path = artifact_path or ARTIFACT_PATH
+    sha = _file_sha(path)
+    matcher = load_artifact(artifact_path)
+    if (matcher and matcher.get("format") == ARTIFACT_FORMAT and matcher.get("sha256") == sha
+            and (matcher.get("automaton") is not None or not ahocorasick)):
+        return matcher
+    matcher = compile_taxonomy(path)
+    try:
+        save_artifact(matcher, artifact_path)
+    except Exception as e:
+        print(f"Warning: could not write taxonomy artifact {artifact_path}: {e}")
+    return matcher
+
+
+def reload(path=None, artifact_path=None, strict=False):
+    """
+    Force a reload of the taxonomy. If the file is missing or invalid and a matcher is already
+    loaded, the previous one is kept (a half-saved edit should not take the app down) and the
+    failed file state is remembered, so it is retried only after the file changes again.
+    With strict=True the error is raised even when a previous matcher is kept.
+    """
+    global _current, _current_stamp
+    path = path or TAXONOMY_PATH
+    with _lock:
+        stamp = None
+        try:
+            stamp = _file_stamp(path)
+            matcher = load_matcher(path, artifact_path)
+        except Exception as e:
+            if _current is None:
+                raise
+            if stamp is not None:
+                _current_stamp = stamp
+            if strict:
+                raise
+            print(f"Warning: taxonomy reload failed, keeping version {_current['tag']}: {e}")
+            return _current
+        _current, _current_stamp = matcher, stamp
+        return matcher
+
+
+def get_matcher(path=None, artifact_path=None):
+    """Return the current matcher, reloading it first if the taxonomy file changed on disk."""
+    path = path or TAXONOMY_PATH
+    try:
+        stamp = _file_stamp(path)
+    except OSError:
+        stamp = None
+    if _current is None or (stamp is not None and stamp != _current_stamp):
+        return reload(path, artifact_path)
+    return _current
+
+
+def current_tag(refresh=True):
+    """
+    Tag ("<version>+<sha8>") of the taxonomy in use. With refresh=True the file is checked and
+    reloaded if it changed; with refresh=False the loaded tag is returned as is (None if nothing is loaded).
+    """
+    if refresh:
+        return get_matcher()["tag"]
+    return _current["tag"] if _current else None
+
+
+def match_fields(text, matcher=None):
+    """Return {field: [terms contained in text]} (case-insensitive, taxonomy order) in one pass over text."""
+    matcher = matcher or get_matcher()
+    text_lower = str(text).lower()
+    automaton = matcher.get("automaton")
+    if automaton is not None and ahocorasick:
+        found = {field: set() for field in FIELDS}
+        for _, hits in automaton.iter(text_lower):
+            for field, idx in hits:
+                found[field].add(idx)
+        return {field: [matcher["terms"][field][idx] for idx in sorted(found[field])] for field in FIELDS}
+    return {field: [term for term, low in zip(matcher["terms"][field], matcher["lowered"][field]) if low in text_lower]
+            for field in FIELDS}
+
+
+def match_terms(text, field, matcher=None):
+    """Return the taxonomy terms of a single field contained in text."""
+    return match_fields(text, matcher)[field]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compile the keyword taxonomy into the matcher artifact.")
+    ap.add_argument("--input", "-i", required=False, default=TAXONOMY_PATH,
+                    help=f"Path to taxonomy JSON (default: {TAXONOMY_PATH})")
+    args = ap.parse_args()
+
+    input_path = args.input
+    if not os.path.exists(input_path):
+        raise FileNotFoundError(f"Taxonomy file not found: {input_path}")
+
+    matcher = compile_taxonomy(input_path)
+    save_artifact(matcher, ARTIFACT_PATH)
+    counts = ", ".join(f"{field}: {len(matcher['terms'][field])}" for field in FIELDS)
+    engine = "aho-corasick" if matcher["automaton"] is not None else "substring scan"
+    print(f"Saved taxonomy {matcher['tag']} to: {ARTIFACT_PATH} ({counts}; {engine})")
+
+
+if __name__ == "__main__":
+    main()
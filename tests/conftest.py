@@ -0,0 +1,7 @@
+import os
+import sys
+
+# scripts/ is not a package; make its modules importable the same way app.py does.
+SCRIPT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
@@ -0,0 +1,43 @@
+import math
+
+import pandas as pd
+import pytest
+
+import create_eval_csv
+import evaluate_scoring
+
+
+def test_ndcg_at_k_hand_computed():
+    # DCG = 3/log2(3) + 1/log2(4); ideal DCG = 3 + 1/log2(3)
+    expected = (3 / math.log2(3) + 0.5) / (3 + 1 / math.log2(3))
+    assert evaluate_scoring.ndcg_at_k([0, 2, 1], 3) == pytest.approx(expected)
+    assert evaluate_scoring.ndcg_at_k([2, 1, 0], 3) == pytest.approx(1.0)
+    assert evaluate_scoring.ndcg_at_k([0, 0], 2) == 0.0
+
+
+def test_precision_at_k_hand_computed():
+    assert evaluate_scoring.precision_at_k([0, 2, 1], 2) == 0.5
+    assert evaluate_scoring.precision_at_k([1, 1, 0, 0], 4) == 0.5
+
+
+def _dataset():
+    rows = []
+    for i in range(12):
+        category = ["HR", "DESIGNER", "CHEF"][i % 3]
+        rows.append({"ID": i, "resume_text": f"text {i}", "Category": category})
+    return pd.DataFrame(rows)
+
+
+def test_build_eval_set_is_seeded_and_labelled():
+    sampled_a, labels_a = create_eval_csv.build_eval_set(_dataset(), per_category=2, seed=7)
+    sampled_b, labels_b = create_eval_csv.build_eval_set(_dataset(), per_category=2, seed=7)
+    assert sampled_a["ID"].tolist() == sampled_b["ID"].tolist()
+    assert len(sampled_a) == 6
+    hr_jd4 = labels_a[(labels_a["category"] == "HR") & (labels_a["jd_id"] == "JD4")]
+    assert set(hr_jd4["relevance_score"]) == {2}
+    assert labels_b.equals(labels_a)
+
+
+def test_build_eval_set_rejects_unlabelled_jd():
+    with pytest.raises(ValueError, match="CUSTOM"):
+        create_eval_csv.build_eval_set(_dataset(), [{"jd_id": "CUSTOM", "title": "x", "skills": []}])
@@ -0,0 +1,29 @@
+import pandas as pd
+from pandas.testing import assert_frame_equal
+
+import match_resumes
+
+
+PARSED = pd.DataFrame([
+    {"resume_id": 1, "skills": "Python, SQL", "education": "B.Tech", "roles": "Software Engineer"},
+    {"resume_id": 2, "skills": "Excel, Power BI", "education": "", "roles": "Data Analyst"},
+    {"resume_id": 3, "skills": float("nan"), "education": float("nan"), "roles": float("nan")},
+])
+
+
+def test_compute_similarity_weights():
+    jd = {"skills": ["Python", "SQL", "AI", "Excel"], "roles": ["Software Engineer"], "education": ["MBA"]}
+    score, skills, roles, edu = match_resumes.compute_similarity("python, sql", "Software Engineer", "B.Tech", jd)
+    assert score == 0.55  # 0.5 * 2/4 + 0.3 * 1/1 + 0.2 * 0/1
+    assert skills == {"python", "sql"}
+    assert roles == {"software engineer"}
+    assert edu == set()
+
+
+def test_match_all_fast_matches_match_all():
+    jds = match_resumes.DEFAULT_JDS + [{"jd_id": "E", "title": "Edu", "skills": [], "education": ["b.tech"]}]
+    assert_frame_equal(match_resumes.match_all_fast(PARSED, jds), match_resumes.match_all(PARSED, jds))
+
+
+def test_default_scoring_mode_is_registered():
+    assert match_resumes.DEFAULT_SCORING_MODE in match_resumes.SCORING_MODES
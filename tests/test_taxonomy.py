@@ -0,0 +1,127 @@
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import parse_resumes
+import taxonomy
+
+
+TAXONOMY_V1 = {"version": "1", "skills": ["Python", "SQL", "Machine Learning"],
+               "education": ["B.Tech", "MBA"], "roles": ["Engineer", "Software Engineer"]}
+
+
+@pytest.fixture
+def tax(tmp_path, monkeypatch):
+    """Point taxonomy.py at a temporary taxonomy.json / artifact and start with nothing loaded."""
+    path = tmp_path / "taxonomy.json"
+    artifact = tmp_path / "output" / "taxonomy_matcher.pkl"
+    monkeypatch.setattr(taxonomy, "TAXONOMY_PATH", str(path))
+    monkeypatch.setattr(taxonomy, "ARTIFACT_PATH", str(artifact))
+    monkeypatch.setattr(taxonomy, "_current", None)
+    monkeypatch.setattr(taxonomy, "_current_stamp", None)
+    mtime = [1_000_000_000]
+
+    def write(data):
+        path.write_text(data if isinstance(data, str) else json.dumps(data), encoding="utf-8")
+        mtime[0] += 10  # explicit mtimes so edits are seen regardless of filesystem timestamp resolution
+        os.utime(path, (mtime[0], mtime[0]))
+
+    write(TAXONOMY_V1)
+    return write, str(path), str(artifact)
+
+
+def test_artifact_reused_when_sha_matches(tax, monkeypatch):
+    write, path, artifact = tax
+    first = taxonomy.load_matcher(path, artifact)
+    assert os.path.exists(artifact)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("taxonomy should not be recompiled")
+    monkeypatch.setattr(taxonomy, "compile_taxonomy", fail)
+    assert taxonomy.load_matcher(path, artifact)["tag"] == first["tag"]
+
+
+def test_artifact_recompiled_when_file_changes(tax):
+    write, path, artifact = tax
+    first = taxonomy.load_matcher(path, artifact)
+    write(dict(TAXONOMY_V1, skills=["Python", "Excel"]))
+    second = taxonomy.load_matcher(path, artifact)
+    assert second["tag"] != first["tag"]
+    assert taxonomy.load_artifact(artifact)["sha256"] == second["sha256"]
+
+
+def test_get_matcher_picks_up_edit(tax):
+    write, _, _ = tax
+    assert taxonomy.match_terms("excel and python", "skills") == ["Python"]
+    write(dict(TAXONOMY_V1, version="2", skills=["Python", "Excel"]))
+    assert taxonomy.match_terms("excel and python", "skills") == ["Python", "Excel"]
+    assert taxonomy.current_tag().startswith("2+")
+
+
+def test_broken_edit_keeps_previous_tag_and_warns_once(tax, capsys):
+    write, _, _ = tax
+    tag = taxonomy.current_tag()
+    write("{broken")
+    for _ in range(3):
+        assert taxonomy.current_tag() == tag
+    assert capsys.readouterr().out.count("Warning: taxonomy reload failed") == 1
+
+    with pytest.raises(ValueError):
+        taxonomy.reload(strict=True)
+    assert taxonomy.current_tag(refresh=False) == tag
+
+
+def test_load_parsed_is_none_after_edit(tax, tmp_path):
+    write, _, _ = tax
+    df = pd.DataFrame([{"ID": 1, "resume_text": "Software Engineer, B.Tech, Python"}])
+    parsed_path = tmp_path / "parsed.csv"
+    parse_resumes.parse_resumes_df(df).to_csv(parsed_path, index=False)
+    assert parse_resumes.load_parsed(str(parsed_path)) is not None
+
+    write(dict(TAXONOMY_V1, skills=["Python", "SQL"]))
+    assert parse_resumes.load_parsed(str(parsed_path)) is None
+
+
+def test_engines_return_same_matches(tax):
+    pytest.importorskip("ahocorasick")
+    _, path, _ = tax
+    matcher = taxonomy.compile_taxonomy(path)
+    assert matcher["automaton"] is not None
+    substring_matcher = dict(matcher, automaton=None)
+    for text in ["Senior Software Engineer: python, machine learning; MBA",
+                 "B.TECH engineer with sql", "nothing relevant", ""]:
+        assert taxonomy.match_fields(text, matcher) == taxonomy.match_fields(text, substring_matcher)
+
+
+def test_compile_hashes_the_bytes_it_parsed(tax, monkeypatch):
+    write, path, _ = tax
+    real_open = open
+    reads = []
+
+    def open_then_edit(file, mode="r", *args, **kwargs):
+        # hand back the current contents, then save a new version, as if edited mid-reload
+        with real_open(file, mode, *args, **kwargs) as f:
+            content = f.read()
+        if not reads:
+            write(dict(TAXONOMY_V1, version="2", skills=["Python", "Excel"]))
+        reads.append(file)
+        return io.BytesIO(content) if isinstance(content, bytes) else io.StringIO(content)
+    monkeypatch.setattr(taxonomy, "open", open_then_edit, raising=False)
+
+    matcher = taxonomy.compile_taxonomy(path)
+    v1_sha = hashlib.sha256(json.dumps(TAXONOMY_V1).encode("utf-8")).hexdigest()
+    assert matcher["sha256"] == v1_sha
+    assert matcher["tag"] == f"1+{v1_sha[:8]}"
+    assert matcher["terms"]["skills"] == TAXONOMY_V1["skills"]
+
+
+def test_artifact_path_resolved_at_call_time(tax):
+    _, path, artifact = tax
+    matcher = taxonomy.compile_taxonomy(path)
+    taxonomy.save_artifact(matcher)
+    assert os.path.exists(artifact)
+    assert taxonomy.load_artifact()["sha256"] == matcher["sha256"]